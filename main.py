@@ -1,3 +1,4 @@
+import asyncio
 import os
 from datetime import datetime
 from src.terminal import SimplexTerminal
@@ -17,8 +18,8 @@ def main():
         logger.info("Configuration loaded successfully")
 
         # Ensure points directories exist
-        points_dir = os.path.dirname(config['points']['file'])
-        export_dir = config['points']['export_dir']
+        points_dir = os.path.dirname(config.points.file)
+        export_dir = config.points.export_dir
         os.makedirs(points_dir, exist_ok=True)
         os.makedirs(export_dir, exist_ok=True)
 
@@ -26,29 +27,29 @@ def main():
         points_manager = PointsManager()
         try:
             points_manager.load_points_file(
-                file_path=config['points']['file'],
-                encoding=config['points']['encoding']
+                file_path=config.points.file,
+                encoding=config.points.encoding
             )
-            logger.info(f"Successfully loaded points file: {config['points']['file']}")
+            logger.info(f"Successfully loaded points file: {config.points.file}")
         except Exception as e:
             logger.error(f"Failed to load points file: {e}")
             raise
 
         # Initialize terminal
         terminal = SimplexTerminal(
-            port=config['serial']['port'],
-            baudrate=config['serial']['baudrate']
+            port=config.serial.port,
+            baudrate=config.serial.baudrate
         )
 
         # Initialize monitor with points manager
         monitor = StatusMonitor(
             terminal=terminal,
             points_manager=points_manager,
-            poll_interval=config['monitor']['poll_interval']
+            poll_interval=config.monitor.poll_interval
         )
 
         # Start monitoring
-        monitor.start_monitoring(config['panel']['passcode'])
+        asyncio.run(monitor.start_monitoring(config.panel.passcode))
 
     except KeyboardInterrupt:
         logger.info("Stopping monitor due to user interrupt...")
@@ -61,12 +62,12 @@ def main():
         if 'points_manager' in locals():
             try:
                 export_file = os.path.join(
-                    config['points']['export_dir'],
+                    config.points.export_dir,
                     f'point_status_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
                 )
                 points_manager.export_points(
                     export_file,
-                    encoding=config['points']['export_encoding']
+                    encoding=config.points.export_encoding
                 )
                 logger.info(f"Exported final point status to: {export_file}")
             except Exception as e:
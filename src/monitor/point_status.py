@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Dict, Any
 
-@dataclass
+@dataclass(slots=True)
 class PointStatus:
     point_id: str
     status: str
@@ -56,4 +56,5 @@ class StatusChange:
     new_status: Optional[PointStatus]
     enriched_data: Optional[Dict[str, Any]] = None
     previous_enriched_data: Optional[Dict[str, Any]] = None
+    description: Optional[str] = None
     timestamp: datetime = datetime.now()
\ No newline at end of file
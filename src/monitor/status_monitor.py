@@ -1,5 +1,5 @@
-from typing import Dict, List
-import time
+import asyncio
+from typing import Dict, List, Optional
 from ..terminal.simplex_terminal import SimplexTerminal
 from .point_status import PointStatus, StatusChange
 from ..points import PointsManager
@@ -9,66 +9,123 @@ logger = get_logger(__name__)
 
 
 class StatusMonitor:
-    def __init__(self, terminal: SimplexTerminal, points_manager: PointsManager, poll_interval: int = 60):
+    def __init__(self, terminal: SimplexTerminal, points_manager: PointsManager, poll_interval: int = 60,
+                 enrich_changes: bool = False):
         self.terminal = terminal
         self.points_manager = points_manager
         self.poll_interval = poll_interval
+        self.enrich_changes = enrich_changes  # Attach full enriched dicts to each change
         self.current_states: Dict[str, PointStatus] = {}
+        self._last_clist_response: Optional[str] = None
+        self._relogin_requested = False  # Set by the consumer after a processing error
         self.running = False
 
     def detect_changes(self, new_states: Dict[str, PointStatus]) -> List[StatusChange]:
         """Detect changes between current and new states."""
         changes = []
 
+        # Update point status in points manager
+        self.points_manager.update_point_statuses(
+            (point_id, new_status.status) for point_id, new_status in new_states.items()
+        )
+
+        # Set algebra decides membership; iteration below follows panel (CLIST)
+        # order so change events are logged deterministically
+        added_ids = new_states.keys() - self.current_states.keys()
+        cleared_ids = self.current_states.keys() - new_states.keys()
+
+        enrich = self.enrich_changes
+        get_enriched = self.points_manager.get_enriched_status
+        get_description = self.points_manager.get_description
+
         # Check for new or changed points
         for point_id, new_status in new_states.items():
-            # Update point status in points manager
-            self.points_manager.update_point_status(point_id, new_status.status)
-
-            if point_id not in self.current_states:
-                enriched_status = self.points_manager.get_enriched_status(new_status)
+            if point_id in added_ids:
                 changes.append(StatusChange(
                     'NEW',
                     None,
                     new_status,  # Keep original PointStatus object
-                    enriched_data=enriched_status  # Add enriched data separately
+                    enriched_data=get_enriched(new_status) if enrich else None,
+                    description=get_description(point_id)
                 ))
-            elif new_status.status != self.current_states[point_id].status:
-                old_enriched = self.points_manager.get_enriched_status(self.current_states[point_id])
-                new_enriched = self.points_manager.get_enriched_status(new_status)
+                continue
+
+            old_status = self.current_states[point_id]
+            if new_status.status != old_status.status:
                 changes.append(StatusChange(
                     'CHANGED',
-                    self.current_states[point_id],
+                    old_status,
                     new_status,
-                    enriched_data=new_enriched,
-                    previous_enriched_data=old_enriched
+                    enriched_data=get_enriched(new_status) if enrich else None,
+                    previous_enriched_data=get_enriched(old_status) if enrich else None,
+                    description=get_description(point_id)
                 ))
 
         # Check for cleared points
-        for point_id in self.current_states:
-            if point_id not in new_states:
-                old_enriched = self.points_manager.get_enriched_status(self.current_states[point_id])
-                changes.append(StatusChange(
-                    'CLEARED',
-                    self.current_states[point_id],
-                    None,
-                    previous_enriched_data=old_enriched
-                ))
+        if cleared_ids:
+            for point_id, old_status in self.current_states.items():
+                if point_id in cleared_ids:
+                    changes.append(StatusChange(
+                        'CLEARED',
+                        old_status,
+                        None,
+                        previous_enriched_data=get_enriched(old_status) if enrich else None,
+                        description=get_description(point_id)
+                    ))
 
         return changes
 
-    def start_monitoring(self, passcode: str):
+    async def start_monitoring(self, passcode: str):
         """Start the monitoring loop."""
-        if not self.terminal.login(passcode):
+        loop = asyncio.get_running_loop()
+
+        # pyserial is blocking, so panel I/O runs in the default executor
+        if not await loop.run_in_executor(None, self.terminal.login, passcode):
             logger.error("Failed to login")
             return
 
         self.running = True
         logger.info("Starting monitoring loop")
 
+        # Fetch the next CLIST while the previous one is still being processed
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        await asyncio.gather(
+            self._poll_panel(passcode, queue),
+            self._process_responses(queue)
+        )
+
+    async def _poll_panel(self, passcode: str, queue: asyncio.Queue):
+        """Poll CLIST and queue each response that differs from the last one."""
+        loop = asyncio.get_running_loop()
+
         while self.running:
+            # send_command reports panel errors as an empty response, so a relogin
+            # is only triggered by a failure to process what the panel sent
+            if self._relogin_requested:
+                self._relogin_requested = False
+                if not await loop.run_in_executor(None, self.terminal.login, passcode):
+                    logger.error("Failed to relogin after error")
+                    break
+
+            response = await loop.run_in_executor(None, self.terminal.send_command, "CLIST")
+            # Unchanged panel state needs no parsing or diffing
+            if response != self._last_clist_response:
+                self._last_clist_response = response
+                await queue.put(response)
+
+            await asyncio.sleep(self.poll_interval)
+
+        await queue.put(None)  # Tell the consumer to stop
+
+    async def _process_responses(self, queue: asyncio.Queue):
+        """Parse queued CLIST responses and handle the resulting changes."""
+        while True:
+            response = await queue.get()
+            if response is None:
+                break
+
             try:
-                points_data = self.terminal.get_clist()
+                points_data = self.terminal.parse_clist(response)
                 new_states = {
                     p['id']: PointStatus.from_clist_line(p['id'], p['status'])
                     for p in points_data
@@ -78,32 +135,29 @@ class StatusMonitor:
                 self._handle_changes(changes)
                 self.current_states = new_states
 
-                time.sleep(self.poll_interval)
-
             except Exception as e:
                 logger.error(f"Error during monitoring: {e}", exc_info=True)
-                if not self.terminal.login(passcode):
-                    logger.error("Failed to relogin after error")
-                    break
+                # Log in again before the next poll, and make sure its response is
+                # processed even if the panel state is unchanged
+                self._relogin_requested = True
+                self._last_clist_response = None
 
     def _handle_changes(self, changes: List[StatusChange]):
         """Handle detected changes."""
         for change in changes:
+            description = change.description or 'No description'
             if change.change_type == 'NEW':
-                description = change.enriched_data.get('description', 'No description')
                 logger.info(
                     f"New point: {change.new_status.point_id} - {change.new_status.status} "
                     f"({description})"
                 )
             elif change.change_type == 'CHANGED':
-                description = change.enriched_data.get('description', 'No description')
                 logger.info(
                     f"Status changed: {change.new_status.point_id} "
                     f"from {change.previous_status.status} to {change.new_status.status} "
                     f"({description})"
                 )
             elif change.change_type == 'CLEARED':
-                description = change.previous_enriched_data.get('description', 'No description')
                 logger.info(
                     f"Point cleared: {change.previous_status.point_id} "
                     f"({description})"
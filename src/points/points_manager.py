@@ -1,6 +1,5 @@
-import pandas as pd
 from dataclasses import dataclass
-from typing import Dict, Optional, List
+from typing import Any, Dict, Iterable, Optional, List, Tuple
 from datetime import datetime
 import csv
 import re
@@ -8,8 +7,11 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Point ID prefix (Mx-xxx) at the start of a description
+_POINT_ID_RE = re.compile(r'^(M\d+-\d+)')
 
-@dataclass
+
+@dataclass(slots=True)
 class PointInfo:
     point_id: str
     hardware_type: str
@@ -24,6 +26,10 @@ class PointInfo:
 class PointsManager:
     def __init__(self):
         self.points: Dict[str, PointInfo] = {}
+        # Resolved point info per CLIST point ID (None when unknown)
+        self._lookup_cache: Dict[str, Optional[PointInfo]] = {}
+        # Point info fields merged into enriched statuses, per CLIST point ID
+        self._enrichment_cache: Dict[str, Optional[Dict[str, Any]]] = {}
         # Hebrew conversion mapping
         self.unicode_to_hebrew_map = {
             '\xa0': 'א', '\xa1': 'ב', '\xa2': 'ג', '\xa3': 'ד', '\xa4': 'ה', '\xa5': 'ו',
@@ -33,26 +39,24 @@ class PointsManager:
             '\xb3': 'ף', '\xb5': 'ץ', '\xaf': 'ן'
         }
         self.hebrew_to_unicode_map = {v: k for k, v in self.unicode_to_hebrew_map.items()}
+        # Codepoint table so str.translate can do the mapping in a single C loop
+        self._translate_table = str.maketrans(self.unicode_to_hebrew_map)
 
     def convert_and_reverse_hebrew(self, text: str) -> str:
         """Convert and reverse Hebrew text properly"""
         try:
-            # Pattern to match Mx-xxx format at start of string
-            point_id_pattern = r'^(M\d+[-]\d+)'
-            match = re.match(point_id_pattern, text)
+            match = _POINT_ID_RE.match(text)
 
             if not match:
                 # If no point ID found, treat entire text as Hebrew
-                converted = ''.join(self.unicode_to_hebrew_map.get(char, char)
-                                    for char in text)[::-1]
+                converted = text.translate(self._translate_table)[::-1]
                 return converted
 
             point_id = match.group(1)  # Get the matched point ID
             hebrew_text = text[len(point_id):].strip()  # Get rest of text
 
             # Convert Hebrew characters and reverse
-            converted_hebrew = ''.join(self.unicode_to_hebrew_map.get(char, char)
-                                       for char in hebrew_text)[::-1]
+            converted_hebrew = hebrew_text.translate(self._translate_table)[::-1]
 
             # Return in desired format: point_id followed by Hebrew
             return f"{point_id} {converted_hebrew}"
@@ -63,38 +67,39 @@ class PointsManager:
 
     def load_points_file(self, file_path: str, encoding: str = 'windows-1252') -> None:
         """Load points from CSV file with Hebrew text handling"""
+        self._lookup_cache.clear()
+        self._enrichment_cache.clear()
         try:
-            df = pd.read_csv(file_path,
-                             encoding=encoding,
-                             header=None,
-                             delimiter=',',
-                             skipinitialspace=True)
-
-            for _, row in df.iterrows():
-                try:
-                    fields = [str(field).strip() for field in row]
-
-                    # Convert Hebrew text in description
-                    description = self.convert_and_reverse_hebrew(fields[3])
-                    logger.debug(f"Converted description: {description}")
-
-                    point_info = PointInfo(
-                        point_id=fields[0],
-                        hardware_type=fields[1],
-                        point_type=fields[2],
-                        description=description,  # Converted Hebrew text
-                        location=fields[4],
-                        custom_fields=fields[5:],
-                        last_status=None,
-                        last_update=None
-                    )
-
-                    # Use point_id without trailing -0 as key
-                    key = point_info.point_id.rsplit('-0', 1)[0]
-                    self.points[key] = point_info
-
-                except Exception as e:
-                    logger.error(f"Error processing row {fields[0] if fields else 'unknown'}: {str(e)}")
+            with open(file_path, newline='', encoding=encoding) as f:
+                for row in csv.reader(f, skipinitialspace=True):
+                    if not row:
+                        continue
+                    try:
+                        fields = [field.strip() for field in row]
+                        # Short rows still load, with the missing columns empty
+                        fields += [''] * (5 - len(fields))
+
+                        # Convert Hebrew text in description
+                        description = self.convert_and_reverse_hebrew(fields[3])
+                        logger.debug(f"Converted description: {description}")
+
+                        point_info = PointInfo(
+                            point_id=fields[0],
+                            hardware_type=fields[1],
+                            point_type=fields[2],
+                            description=description,  # Converted Hebrew text
+                            location=fields[4],
+                            custom_fields=fields[5:],
+                            last_status=None,
+                            last_update=None
+                        )
+
+                        # Use point_id without trailing -0 as key
+                        key = point_info.point_id.rsplit('-0', 1)[0]
+                        self.points[key] = point_info
+
+                    except Exception as e:
+                        logger.error(f"Error processing row {row[0]}: {str(e)}")
 
             logger.info(f"Successfully loaded {len(self.points)} points")
 
@@ -103,47 +108,79 @@ class PointsManager:
 
     def get_point_info(self, point_id: str) -> Optional[PointInfo]:
         """Get point info, handling the -0 suffix"""
-        # Try exact match first
+        if point_id in self._lookup_cache:
+            return self._lookup_cache[point_id]
+
+        # Try exact match first, then without -0 suffix
         point_info = self.points.get(point_id)
-        if point_info:
-            return point_info
+        if not point_info:
+            base_id = point_id.rsplit('-0', 1)[0]
+            point_info = self.points.get(base_id)
 
-        # Try without -0 suffix
-        base_id = point_id.rsplit('-0', 1)[0]
-        return self.points.get(base_id)
+        self._lookup_cache[point_id] = point_info
+        return point_info
+
+    def get_description(self, point_id: str) -> Optional[str]:
+        """Get the configured description for a point, if known"""
+        point_info = self.get_point_info(point_id)
+        return point_info.description if point_info else None
 
     def get_enriched_status(self, point_status: 'PointStatus') -> Dict:
         """Enrich a point status with description information"""
-        point_info = self.get_point_info(point_status.point_id)
-        if not point_info:
-            logger.warning(f"No point information found for {point_status.point_id}")
-            return point_status.__dict__
-
-        return {
-            **point_status.__dict__,
-            'description': point_info.description,
-            'location': point_info.location,
-            'hardware_type': point_info.hardware_type,
-            'configured_type': point_info.point_type,
-            'custom_fields': point_info.custom_fields
+        point_id = point_status.point_id
+        if point_id in self._enrichment_cache:
+            enrichment = self._enrichment_cache[point_id]
+        else:
+            # Point info is fixed once loaded, so build its part of the dict once
+            point_info = self.get_point_info(point_id)
+            enrichment = {
+                'description': point_info.description,
+                'location': point_info.location,
+                'hardware_type': point_info.hardware_type,
+                'configured_type': point_info.point_type,
+                'custom_fields': point_info.custom_fields
+            } if point_info else None
+            self._enrichment_cache[point_id] = enrichment
+
+        enriched = {
+            'point_id': point_status.point_id,
+            'status': point_status.status,
+            'timestamp': point_status.timestamp,
+            'point_type': point_status.point_type,
+            'state_type': point_status.state_type,
+            'is_active': point_status.is_active,
+            'is_acknowledged': point_status.is_acknowledged
         }
 
+        if not enrichment:
+            logger.warning(f"No point information found for {point_id}")
+            return enriched
+
+        enriched.update(enrichment)
+        return enriched
+
     def update_point_status(self, point_id: str, status: str) -> None:
         """Update status for a point"""
-        point_info = self.get_point_info(point_id)
-        if point_info:
-            point_info.last_status = status
-            point_info.last_update = datetime.now()
-        else:
-            logger.warning(f"Attempted to update status for unknown point: {point_id}")
+        self.update_point_statuses(((point_id, status),))
+
+    def update_point_statuses(self, statuses: Iterable[Tuple[str, str]]) -> None:
+        """Update statuses for a whole poll, stamped with a single timestamp"""
+        now = datetime.now()
+        for point_id, status in statuses:
+            point_info = self.get_point_info(point_id)
+            if point_info:
+                point_info.last_status = status
+                point_info.last_update = now
+            else:
+                logger.warning(f"Attempted to update status for unknown point: {point_id}")
 
     def export_points(self, file_path: str, encoding: str = 'utf-8') -> None:
         """Export points to CSV with status information"""
         try:
-            with open(file_path, 'w', newline='', encoding=encoding) as f:
+            with open(file_path, 'w', newline='', encoding=encoding, buffering=1 << 20) as f:
                 writer = csv.writer(f)
-                for point in self.points.values():
-                    writer.writerow([
+                writer.writerows(
+                    (
                         point.point_id,
                         point.hardware_type,
                         point.point_type,
@@ -152,6 +189,8 @@ class PointsManager:
                         point.last_status or 'N/A',
                         point.last_update.isoformat() if point.last_update else 'N/A',
                         *point.custom_fields
-                    ])
+                    )
+                    for point in self.points.values()
+                )
         except Exception as e:
             raise Exception(f"Error exporting points: {str(e)}")
\ No newline at end of file
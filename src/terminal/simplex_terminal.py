@@ -1,15 +1,30 @@
+import re
 import serial
+import sys
 import time
 from typing import List, Dict
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# CLIST line with at least two fields; groups are point ID and status
+_CLIST_RE = re.compile(r'^[^\S\n]*(\S+)[^\S\n]+(\S+).*', re.M)
+
+
+def _ends_with_prompt(buf: bytes) -> bool:
+    """Whether the last non-empty line is the bare '-' prompt.
+
+    Acknowledged statuses also end in '-' (e.g. 'T1-'), so a trailing '-'
+    alone does not mean the panel has finished answering.
+    """
+    return buf.rstrip().rsplit(b'\n', 1)[-1].strip() == b'-'
+
 
 class SimplexTerminal:
-    def __init__(self, port: str, baudrate: int = 19200):
+    def __init__(self, port: str, baudrate: int = 19200, echo_rx: bool = False):
         self.port = port
         self.baudrate = baudrate
+        self._echo_rx = echo_rx  # Print panel responses to stdout for troubleshooting
         self.serial = None
         self._connect()
 
@@ -23,8 +38,13 @@ class SimplexTerminal:
                 bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE,
-                timeout=1
+                timeout=0.05  # Intra-frame gap; _read_response tracks the overall timeout
             )
+            if sys.platform == 'win32':
+                # Default 4 KB driver buffer can overflow on long CLIST output
+                self.serial.set_buffer_size(rx_size=65536)
+            elif sys.platform.startswith('linux'):
+                self._enable_low_latency()
             self.serial.reset_input_buffer()
             self.serial.reset_output_buffer()
             logger.info("Serial connection established")
@@ -32,37 +52,39 @@ class SimplexTerminal:
             logger.error(f"Failed to connect to {self.port}: {e}")
             raise
 
+    def _enable_low_latency(self):
+        """Ask the driver to deliver bytes immediately (ASYNC_LOW_LATENCY)."""
+        try:
+            self.serial.set_low_latency_mode(True)
+            logger.debug("Low-latency mode enabled on serial port")
+        except (AttributeError, ValueError) as e:
+            # Not every UART driver supports TIOCSSERIAL; keep the default mode
+            logger.debug(f"Low-latency mode not available on {self.port}: {e}")
+
     def _read_response(self, timeout: int = 2) -> str:
         """Read response from panel until we get a complete response."""
-        response = ""
         start_time = time.time()
         end_time = start_time + timeout
+        buf = bytearray()
+
+        # Blocking reads: the driver wakes us when data arrives or the
+        # short port timeout expires, so there is no in_waiting polling.
+        while True:
+            chunk = self.serial.read(4096)
+            if chunk:
+                buf += chunk
+                # Reset timeout if we're still receiving data
+                end_time = time.time() + timeout
+            elif _ends_with_prompt(buf):
+                # Complete response (prompt on its own line) and the line went quiet
+                break
+            elif time.time() >= end_time:
+                break
+
+        response = buf.decode('latin1')
+        if self._echo_rx:
+            print(f"\nPanel response: {response}", flush=True)
 
-        print("\nPanel response: ", end='', flush=True)
-
-        while time.time() < end_time:
-            if self.serial.in_waiting:
-                char = self.serial.read()
-                try:
-                    decoded_char = char.decode('latin1')
-                    print(decoded_char, end='', flush=True)  # Immediately print the character
-                    response += decoded_char
-
-                    # Reset timeout if we're still receiving data
-                    if self.serial.in_waiting:
-                        end_time = time.time() + timeout
-
-                    # If we see a complete response (ends with prompt), we can stop
-                    if response.rstrip().endswith('-'):
-                        if not self.serial.in_waiting:  # Make sure buffer is empty
-                            time.sleep(0.1)  # Small delay to ensure we got everything
-                            if not self.serial.in_waiting:
-                                break
-
-                except Exception as e:
-                    logger.error(f"Error decoding character: {e}")
-
-        print()  # New line after complete response
         total_time = time.time() - start_time
         logger.debug(f"Response received in {total_time:.2f} seconds")
         logger.debug(f"Complete response: {repr(response)}")
@@ -112,7 +134,7 @@ class SimplexTerminal:
         """Get point status list."""
         try:
             response = self.send_command("CLIST")
-            points = self._parse_clist(response)
+            points = self.parse_clist(response)
             logger.debug(f"Parsed {len(points)} points from CLIST")
             return points
 
@@ -120,23 +142,13 @@ class SimplexTerminal:
             logger.error(f"CLIST command failed: {e}")
             return []
 
-    def _parse_clist(self, response: str) -> List[Dict[str, str]]:
+    def parse_clist(self, response: str) -> List[Dict[str, str]]:
         """Parse CLIST response."""
-        points = []
-        for line in response.split('\n'):
-            line = line.strip()
-            if not line or line == "-" or "CLIST" in line:
-                continue
-            try:
-                parts = line.split()
-                if len(parts) >= 2:
-                    points.append({
-                        'id': parts[0],
-                        'status': parts[1]
-                    })
-            except Exception as e:
-                logger.error(f"Error parsing line '{line}': {e}")
-        return points
+        return [
+            {'id': m[1], 'status': m[2]}
+            for m in _CLIST_RE.finditer(response)
+            if 'CLIST' not in m[0]
+        ]
 
     def close(self):
         """Close the serial connection."""
@@ -0,0 +1,74 @@
+import os
+import stat
+import tempfile
+import unittest
+from unittest import mock
+
+from src.utils.config import load_config
+
+
+class ConfigCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.tmp_dir.name, 'config.yaml')
+        self.cache_path = self.config_path + '.json'
+        # Keep SIMPLEX_* variables from the environment out of the result
+        env_patch = mock.patch.dict(os.environ, {
+            k: v for k, v in os.environ.items() if not k.startswith('SIMPLEX_')
+        }, clear=True)
+        env_patch.start()
+        self.addCleanup(env_patch.stop)
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.addCleanup(load_config.cache_clear)
+
+    def write_config(self, passcode: str, mtime: float = None):
+        with open(self.config_path, 'w') as f:
+            f.write(f"panel:\n  passcode: '{passcode}'\n")
+        if mtime is not None:
+            os.utime(self.config_path, (mtime, mtime))
+
+    def test_cache_is_written_and_used(self):
+        self.write_config('333')
+        self.assertEqual(load_config(self.config_path).panel.passcode, '333')
+        self.assertTrue(os.path.exists(self.cache_path))
+
+        # Cache hit must not need the memo
+        load_config.cache_clear()
+        self.assertEqual(load_config(self.config_path).panel.passcode, '333')
+
+    def test_replacing_with_older_file_invalidates_cache(self):
+        self.write_config('333')
+        self.assertEqual(load_config(self.config_path).panel.passcode, '333')
+
+        # Same size, older mtime, as left behind by cp -p / rsync -a / tar
+        old_mtime = os.stat(self.config_path).st_mtime - 3600
+        self.write_config('999', mtime=old_mtime)
+        self.assertEqual(load_config(self.config_path).panel.passcode, '999')
+
+        load_config.cache_clear()
+        self.assertEqual(load_config(self.config_path).panel.passcode, '999')
+
+    def test_corrupt_cache_falls_back_to_yaml(self):
+        self.write_config('333')
+        with open(self.cache_path, 'w') as f:
+            f.write('{not json')
+        self.assertEqual(load_config(self.config_path).panel.passcode, '333')
+
+    @unittest.skipIf(os.name == 'nt', "POSIX permission bits")
+    def test_cache_keeps_config_file_permissions(self):
+        self.write_config('333')
+        os.chmod(self.config_path, 0o600)
+        # A cache left by an older run with wider permissions must not survive
+        with open(self.cache_path, 'w') as f:
+            f.write('{}')
+        os.chmod(self.cache_path, 0o644)
+
+        load_config(self.config_path)
+        self.assertEqual(stat.S_IMODE(os.stat(self.cache_path).st_mode), 0o600)
+        self.assertEqual(
+            [name for name in os.listdir(self.tmp_dir.name) if name.endswith('.tmp')], []
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
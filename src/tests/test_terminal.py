@@ -0,0 +1,44 @@
+import importlib.util
+import unittest
+
+HAVE_SERIAL = importlib.util.find_spec('serial') is not None
+
+if HAVE_SERIAL:
+    from src.terminal import SimplexTerminal
+
+
+def split_parse_clist(response: str):
+    """The original line-splitting parser, kept as the reference behaviour."""
+    points = []
+    for line in response.split('\n'):
+        line = line.strip()
+        if not line or line == "-" or "CLIST" in line:
+            continue
+        parts = line.split()
+        if len(parts) >= 2:
+            points.append({'id': parts[0], 'status': parts[1]})
+    return points
+
+
+@unittest.skipUnless(HAVE_SERIAL, "pyserial not installed")
+class ParseClistTest(unittest.TestCase):
+    RESPONSES = {
+        'crlf': "CLIST\r\n@5-1-0 F1*\r\nZN1 T1- EXTRA\r\n\r\n-\r\n",
+        'lfcr': "CLIST\n\r@5-1-0 F1*\n\rZN1 T1-\n\r-\n\r",
+        'tabs': "CLIST\n\t@5-1-0\tF1*\nZN1\x0bT1-\n  M1-2 \t A \n-\n",
+    }
+
+    def setUp(self):
+        # parse_clist does not touch the port, so skip opening one
+        self.terminal = SimplexTerminal.__new__(SimplexTerminal)
+
+    def test_matches_split_parser(self):
+        for name, response in self.RESPONSES.items():
+            with self.subTest(name):
+                points = self.terminal.parse_clist(response)
+                self.assertTrue(points)
+                self.assertEqual(points, split_parse_clist(response))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,63 +1,140 @@
+import copy
+import json
 import yaml
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Any
 
+try:
+    from orjson import loads as _load_json
+except ImportError:  # orjson is optional
+    from json import loads as _load_json
+
+# libyaml-backed loader/dumper when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+# Standard config file locations, in search order (~ expanded once at import)
+_CONFIG_LOCATIONS = (
+    'config/config.yaml',
+    'config.yaml',
+    os.path.expanduser('~/.simplex-monitor/config.yaml'),
+    '/etc/simplex-monitor/config.yaml'
+)
+
+# Default configuration; copied before use, never mutated
+_DEFAULT_CONFIG = {
+    'serial': {
+        'port': 'COM1',
+        'baudrate': 19200,
+        'timeout': 1
+    },
+    'monitor': {
+        'poll_interval': 60,  # seconds
+        'retry_delay': 5,  # seconds between retries
+        'max_retries': 3  # maximum number of login retries
+    },
+    'panel': {
+        'passcode': None,  # Must be set in config file or environment
+    },
+    'logging': {
+        'level': 'INFO',
+        'file': 'logs/monitor.log',
+        'max_size': 1048576,  # 1MB
+        'backup_count': 5,
+        'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    },
+    'points': {
+        'file': 'points/points.csv',
+        'encoding': 'windows-1252',
+        'export_dir': 'points/exports',
+        'export_encoding': 'utf-8'
+    }
+}
+
 
 class ConfigurationError(Exception):
     """Raised when there's an error with the configuration."""
     pass
 
 
-def load_config(config_path: str = None) -> Dict[str, Any]:
+@dataclass(slots=True, frozen=True)
+class SerialConfig:
+    port: str
+    baudrate: int
+    timeout: float
+
+
+@dataclass(slots=True, frozen=True)
+class MonitorConfig:
+    poll_interval: int
+    retry_delay: int
+    max_retries: int
+
+
+@dataclass(slots=True, frozen=True)
+class PanelConfig:
+    passcode: str
+
+
+@dataclass(slots=True, frozen=True)
+class LoggingConfig:
+    level: str
+    file: str
+    max_size: int
+    backup_count: int
+    format: str
+
+
+@dataclass(slots=True, frozen=True)
+class PointsConfig:
+    file: str
+    encoding: str
+    export_dir: str
+    export_encoding: str
+
+
+@dataclass(slots=True, frozen=True)
+class Config:
+    """Validated, read-only application configuration."""
+    serial: SerialConfig
+    monitor: MonitorConfig
+    panel: PanelConfig
+    logging: LoggingConfig
+    points: PointsConfig
+
+
+def load_config(config_path: str = None) -> Config:
     """
     Load configuration from YAML file.
     Falls back to default values if no file is found.
     """
-    # Default configuration
-    default_config = {
-        'serial': {
-            'port': 'COM1',
-            'baudrate': 19200,
-            'timeout': 1
-        },
-        'monitor': {
-            'poll_interval': 60,  # seconds
-            'retry_delay': 5,  # seconds between retries
-            'max_retries': 3  # maximum number of login retries
-        },
-        'panel': {
-            'passcode': None,  # Must be set in config file or environment
-        },
-        'logging': {
-            'level': 'INFO',
-            'file': 'logs/monitor.log',
-            'max_size': 1048576,  # 1MB
-            'backup_count': 5,
-            'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        }
-    }
+    default_config = copy.deepcopy(_DEFAULT_CONFIG)
 
     # If no config path provided, look for it in standard locations
-    if config_path is None:
-        possible_locations = [
-            'config/config.yaml',
-            'config.yaml',
-            os.path.expanduser('~/.simplex-monitor/config.yaml'),
-            '/etc/simplex-monitor/config.yaml'
-        ]
-
-        for loc in possible_locations:
-            if os.path.exists(loc):
-                config_path = loc
-                break
+    possible_locations = _CONFIG_LOCATIONS if config_path is None else (config_path,)
+
+    # A single stat both finds the file and identifies its version for the parse cache
+    config_stat = None
+    for loc in possible_locations:
+        try:
+            config_stat = os.stat(loc)
+        except OSError:
+            continue
+        config_path = loc
+        break
 
     # Load config file if it exists
-    if config_path and os.path.exists(config_path):
+    if config_stat is not None:
         try:
-            with open(config_path, 'r') as f:
-                file_config = yaml.safe_load(f)
-                # Deep update of default config with file config
-                deep_update(default_config, file_config)
+            file_config = _read_config_file(
+                config_path, config_stat.st_mtime_ns, config_stat.st_size, config_stat.st_mode
+            )
+            # Deep update of default config with file config; the parsed file is
+            # shared between calls, so merge a copy of it
+            deep_update(default_config, copy.deepcopy(file_config))
         except Exception as e:
             raise ConfigurationError(f"Error loading config file: {e}")
 
@@ -71,64 +148,134 @@ def load_config(config_path: str = None) -> Dict[str, Any]:
         'SIMPLEX_LOG_FILE': ('logging', 'file')
     }
 
-    # Update config with environment variables if they exist
-    for env_var, config_path in env_mapping.items():
-        if env_var in os.environ:
-            set_nested_value(default_config, config_path, os.environ[env_var])
+    # Numeric settings arrive as strings from the environment
+    int_env_vars = {'SIMPLEX_BAUDRATE', 'SIMPLEX_POLL_INTERVAL'}
+
+    # Collect environment overrides and apply them in a single merge
+    env_config = {}
+    for env_var, path in env_mapping.items():
+        value = os.environ.get(env_var)
+        if value is None:
+            continue
+        if env_var in int_env_vars:
+            try:
+                value = int(value)
+            except ValueError:
+                raise ConfigurationError(f"{env_var} must be an integer, got {value!r}")
+        section = env_config
+        for part in path[:-1]:
+            section = section.setdefault(part, {})
+        section[path[-1]] = value
+
+    if env_config:
+        deep_update(default_config, env_config)
 
     # Validate required settings
     if not default_config['panel']['passcode']:
         raise ConfigurationError("Panel passcode must be set in config file or SIMPLEX_PASSCODE environment variable")
 
-    return default_config
+    return _build_config(default_config)
 
 
-def deep_update(base_dict: dict, update_dict: dict) -> None:
-    """Recursively update a dictionary."""
-    for key, value in update_dict.items():
-        if isinstance(value, dict) and key in base_dict and isinstance(base_dict[key], dict):
-            deep_update(base_dict[key], value)
-        else:
-            base_dict[key] = value
+def _build_config(config: Dict[str, Any]) -> Config:
+    """Convert the merged configuration dict into typed config objects."""
+    try:
+        return Config(
+            serial=SerialConfig(**config['serial']),
+            monitor=MonitorConfig(**config['monitor']),
+            panel=PanelConfig(**config['panel']),
+            logging=LoggingConfig(**config['logging']),
+            points=PointsConfig(**config['points'])
+        )
+    except TypeError as e:
+        raise ConfigurationError(f"Invalid configuration: {e}")
+
+
+@lru_cache(maxsize=None)
+def _read_config_file(config_path: str, mtime_ns: int, size: int, mode: int) -> Dict[str, Any]:
+    """
+    Read a YAML config file through a JSON cache stored next to it.
+    The cache records the mtime and size of the YAML it was built from and is
+    only used on an exact match, so replacing the file with an older copy
+    (cp -p, rsync -a) still invalidates it.
+    Results are memoized per file version and must not be mutated.
+    """
+    cache_path = config_path + '.json'
+    source = {'mtime_ns': mtime_ns, 'size': size}
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = _load_json(f.read())
+        if cached['source'] == source:
+            return cached['config']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # No usable cache, parse the YAML
+
+    with open(config_path, 'rb') as f:
+        file_config = yaml.load(f, Loader=_YAML_LOADER)
+
+    # Only cache configs that survive a JSON round trip unchanged
+    try:
+        data = json.dumps({'source': source, 'config': file_config})
+        if json.loads(data)['config'] == file_config:
+            _write_private_copy(cache_path, data, mode)
+    except (OSError, TypeError, ValueError):
+        pass  # Read-only location or non-JSON values, just skip the cache
+
+    return file_config
 
 
-def set_nested_value(d: dict, path: tuple, value: Any) -> None:
-    """Set a value in a nested dictionary using a path tuple."""
-    current = d
-    for part in path[:-1]:
-        current = current[part]
-    current[path[-1]] = value
+def _write_private_copy(path: str, data: str, mode: int) -> None:
+    """
+    Atomically write data to path with the permission bits of the file it
+    was derived from, so a locked-down config (it holds the panel passcode)
+    does not leak through a world-readable cache.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.unlink(tmp_path)  # Leftover from a crashed run; O_EXCL must create it fresh
+    except FileNotFoundError:
+        pass
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode & 0o777)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Drop memoized config files, e.g. in tests that rewrite them in place
+load_config.cache_clear = _read_config_file.cache_clear
+
+
+def deep_update(base_dict: dict, update_dict: dict) -> None:
+    """Update a dictionary in place, merging nested dictionaries."""
+    stack = [(base_dict, update_dict)]
+    while stack:
+        base, update = stack.pop()
+        for key, value in update.items():
+            base_value = base.get(key)
+            if type(value) is dict and type(base_value) is dict:
+                stack.append((base_value, value))
+            else:
+                base[key] = value
 
 
 def create_default_config(path: str = 'config/config.yaml'):
     """Create a default configuration file."""
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-
-    default_config = {
-        'serial': {
-            'port': 'COM9',
-            'baudrate': 19200,
-            'timeout': 1
-        },
-        'monitor': {
-            'poll_interval': 60,
-            'retry_delay': 5,
-            'max_retries': 3
-        },
-        'panel': {
-            'passcode': 'CHANGE_ME'  # Remember to change this
-        },
-        'logging': {
-            'level': 'INFO',
-            'file': 'logs/monitor.log',
-            'max_size': 1048576,
-            'backup_count': 5,
-            'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        }
-    }
+    config_dir = os.path.dirname(path)
+    if config_dir and not os.path.isdir(config_dir):
+        os.makedirs(config_dir, exist_ok=True)
+
+    default_config = copy.deepcopy(_DEFAULT_CONFIG)
+    default_config['panel']['passcode'] = 'CHANGE_ME'  # Remember to change this
 
     with open(path, 'w') as f:
-        yaml.dump(default_config, f, default_flow_style=False)
+        yaml.dump(default_config, f, Dumper=_YAML_DUMPER, default_flow_style=False)
 
 
 if __name__ == '__main__':
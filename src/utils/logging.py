@@ -1,11 +1,19 @@
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from typing import Optional
-from .config import load_config
+from .config import Config, load_config
 
+# Caller-lookup marker used by the logging module; None disables the stack walk
+_SRCFILE = logging._srcfile
 
-def setup_logging(config: Optional[dict] = None) -> None:
+# Background listener that owns the file and console handlers
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging(config: Optional[Config] = None) -> None:
     """
     Setup logging configuration.
     If no config is provided, loads it using load_config()
@@ -13,20 +21,35 @@ def setup_logging(config: Optional[dict] = None) -> None:
     if config is None:
         config = load_config()
 
-    log_config = config['logging']
+    log_config = config.logging
+
+    # Release the previous listener and its file handle before reopening the log
+    _stop_listener()
 
     # Create logs directory if it doesn't exist
-    log_file = log_config['file']
-    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    log_file = log_config.file
+    log_dir = os.path.dirname(log_file)
+    if log_dir and not os.path.isdir(log_dir):
+        os.makedirs(log_dir, exist_ok=True)
+
+    # Skip collecting record metadata the format never uses
+    log_format = log_config.format
+    logging.logThreads = '%(thread' in log_format
+    logging.logProcesses = '%(process' in log_format
+    logging.logMultiprocessing = '%(processName' in log_format
+    logging.logAsyncioTasks = '%(taskName' in log_format
+    needs_caller = any(f'%({field})' in log_format
+                       for field in ('pathname', 'filename', 'module', 'funcName', 'lineno'))
+    logging._srcfile = _SRCFILE if needs_caller else None
 
     # Create formatter
-    formatter = logging.Formatter(log_config['format'])
+    formatter = logging.Formatter(log_format)
 
     # Setup file handler with rotation
     file_handler = logging.handlers.RotatingFileHandler(
         filename=log_file,
-        maxBytes=log_config['max_size'],
-        backupCount=log_config['backup_count']
+        maxBytes=log_config.max_size,
+        backupCount=log_config.backup_count
     )
     file_handler.setFormatter(formatter)
 
@@ -36,17 +59,40 @@ def setup_logging(config: Optional[dict] = None) -> None:
 
     # Setup root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(log_config['level'])
+    level = log_config.level
+    if isinstance(level, str):
+        # Resolve the name once; unknown names still fail in setLevel
+        level = logging.getLevelNamesMapping().get(level.upper(), level)
+    root_logger.setLevel(level)
 
-    # Remove any existing handlers and add our handlers
+    # File and console output happen on the listener thread; logging calls
+    # only enqueue the record
+    global _listener
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+
+    # Remove any existing handlers and add our queue handler
     root_logger.handlers = []
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     # Log startup message
     root_logger.info("Logging system initialized")
 
 
+@atexit.register
+def _stop_listener() -> None:
+    """Flush queued records to the handlers and close them (also runs at exit)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance for a specific module."""
     return logging.getLogger(name)
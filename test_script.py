@@ -1,9 +1,23 @@
+import re
+import sys
 import serial
-import time
+
+# CLIST line with at least two fields, e.g. @5-1-0 F1* or ZN1 F1*
+_POINT_RE = re.compile(rb'^[^\S\n]*(\S+)[^\S\n]+(\S+).*', re.M)
+
+
+def _ends_with_prompt(buf: bytes) -> bool:
+    """Whether the last non-empty line is the bare '-' prompt (not a status like T1-)."""
+    return buf.rstrip().rsplit(b'\n', 1)[-1].strip() == b'-'
 
 
 class SimplexTerminal:
-    def __init__(self, port: str, baudrate: int = 19200):
+    # Byte-exact terminal commands
+    _CMD_LOGIN = b"LOGIN\r"
+    _CMD_CLIST = b"CLIST\r"
+
+    def __init__(self, port: str, baudrate: int = 19200, verbose: bool = False):
+        self.verbose = verbose  # Echo panel responses to stdout
         self.serial = serial.Serial(
             port=port,
             baudrate=baudrate,
@@ -12,58 +26,51 @@ class SimplexTerminal:
             stopbits=serial.STOPBITS_ONE,
             timeout=1
         )
-        self.serial.reset_input_buffer()
-        self.serial.reset_output_buffer()
+        self.reset()
 
     def read_response(self, timeout=2):
-        response = ""
-        end_time = time.time() + timeout
-        while time.time() < end_time:
-            if self.serial.in_waiting:
-                char = self.serial.read()
-                decoded_char = char.decode('latin1')
-                print(decoded_char, end='')
-                response += decoded_char
-        return response
-
-    def login(self, passcode):
+        # Blocking reads: the driver waits for data, so there is no polling loop
+        if self.serial.timeout != timeout:
+            self.serial.timeout = timeout
+        buf = bytearray()
+        while True:
+            # Take everything already buffered in one call (blocks for at least one byte)
+            chunk = self.serial.read(self.serial.in_waiting or 1)
+            if not chunk:
+                break  # Line quiet for the whole timeout
+            buf.extend(chunk)
+            # After the prompt, only wait briefly for anything more
+            wait = 0.1 if _ends_with_prompt(buf) else timeout
+            if self.serial.timeout != wait:
+                self.serial.timeout = wait
+        if self.verbose:
+            sys.stdout.write(buf.decode('latin1'))
+        return bytes(buf)
+
+    def reset(self):
+        """Discard buffered serial data, e.g. before logging in again on a reused terminal."""
         self.serial.reset_input_buffer()
         self.serial.reset_output_buffer()
 
-        self.serial.write("LOGIN\r".encode())
+    def login(self, passcode):
+        self.serial.write(self._CMD_LOGIN)
         response = self.read_response()
 
-        self.serial.write(f"{passcode}\r".encode())
+        self.serial.write(passcode.encode() + b"\r")
         response = self.read_response()
-        return "ACCESS GRANTED" in response
+        return b"ACCESS GRANTED" in response
 
     def get_clist(self):
         """Get and parse CLIST results."""
         print("\nGetting point status list...")
-        self.serial.write("CLIST\r".encode())
+        self.serial.write(self._CMD_CLIST)
         response = self.read_response(timeout=3)  # Longer timeout for potentially long lists
 
-        # Split response into lines and process each line
-        points = []
-        for line in response.split('\n'):
-            # Skip empty lines and prompts
-            line = line.strip()
-            if not line or line == "-" or "CLIST" in line:
-                continue
-
-            # Try to parse the point information
-            try:
-                # Expecting format like: @5-1-0 F1* or ZN1 F1*
-                parts = line.split()
-                if len(parts) >= 2:
-                    point_info = {
-                        'id': parts[0],
-                        'status': parts[1]
-                    }
-                    points.append(point_info)
-            except Exception as e:
-                print(f"Error parsing line: {line}")
-                continue
+        points = [
+            {'id': m.group(1).decode('latin1'), 'status': m.group(2).decode('latin1')}
+            for m in _POINT_RE.finditer(response)
+            if b'CLIST' not in m.group(0)
+        ]
 
         return points
 
@@ -76,7 +83,7 @@ class SimplexTerminal:
 if __name__ == "__main__":
     PORT = "COM9"  # Replace with your COM port
 
-    terminal = SimplexTerminal(PORT)
+    terminal = SimplexTerminal(PORT, verbose=True)
 
     if terminal.login("333"):  # Replace with your actual passcode
         print("\nLogin successful!")